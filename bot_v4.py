@@ -1,6 +1,7 @@
 # bot_v4.py
 
 import os
+import argparse
 import tweepy
 import openai
 import time
@@ -31,6 +32,29 @@ openai.api_key = OPENAI_API_KEY
 
 # Database setup
 DB_NAME = 'twitter_bot.db'
+DRY_RUN_DB_NAME = 'twitter_bot_dry_run.db'
+
+# Follow settings
+DAILY_FOLLOW_LIMIT_MIN = 1
+DAILY_FOLLOW_LIMIT_MAX = 5
+UNFOLLOW_AFTER_HOURS = 48
+
+class SystemClock:
+    # All time lookups and waits go through the module-level clock so that
+    # simulate.py can swap in a virtual one
+    def now(self, tz=None):
+        return datetime.now(tz)
+
+    def utcnow(self):
+        return datetime.utcnow()
+
+    def today(self):
+        return date.today()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+clock = SystemClock()
 
 def init_db():
     conn = sqlite3.connect(DB_NAME)
@@ -99,10 +123,10 @@ def generate_tweet(retries=3):
             return tweet
         except openai.error.OpenAIError as e:
             logging.error(f"OpenAI API error on attempt {attempt + 1}: {e}", exc_info=True)
-            time.sleep(2)
+            clock.sleep(2)
         except Exception as e:
             logging.error(f"Unexpected error on attempt {attempt + 1}: {e}", exc_info=True)
-            time.sleep(2)
+            clock.sleep(2)
     return None
 
 def is_content_appropriate(tweet):
@@ -125,7 +149,7 @@ def post_tweet(client, tweet, dry_run=False):
 def is_within_posting_hours():
     # Define the posting window in EST
     est = pytz.timezone('US/Eastern')
-    current_time_est = datetime.now(est)
+    current_time_est = clock.now(est)
     start_time = current_time_est.replace(hour=8, minute=0, second=0, microsecond=0)
     end_time = current_time_est.replace(hour=22, minute=0, second=0, microsecond=0)
     if start_time <= current_time_est <= end_time:
@@ -135,7 +159,7 @@ def is_within_posting_hours():
 
 def calculate_seconds_until_next_window():
     est = pytz.timezone('US/Eastern')
-    current_time_est = datetime.now(est)
+    current_time_est = clock.now(est)
     next_start_time = current_time_est.replace(hour=8, minute=0, second=0, microsecond=0)
     if current_time_est.hour >= 8:
         next_start_time += timedelta(days=1)
@@ -145,7 +169,7 @@ def calculate_seconds_until_next_window():
 def get_users_followed_today():
     conn = sqlite3.connect(DB_NAME)
     c = conn.cursor()
-    today_str = date.today().isoformat()
+    today_str = clock.today().isoformat()
     c.execute('SELECT users_followed FROM daily_follow_stats WHERE date = ?', (today_str,))
     result = c.fetchone()
     conn.close()
@@ -157,7 +181,7 @@ def get_users_followed_today():
 def update_users_followed_today(count):
     conn = sqlite3.connect(DB_NAME)
     c = conn.cursor()
-    today_str = date.today().isoformat()
+    today_str = clock.today().isoformat()
     c.execute('INSERT OR IGNORE INTO daily_follow_stats (date, users_followed) VALUES (?, 0)', (today_str,))
     c.execute('UPDATE daily_follow_stats SET users_followed = users_followed + ? WHERE date = ?', (count, today_str))
     conn.commit()
@@ -166,12 +190,12 @@ def update_users_followed_today(count):
 def reset_daily_follow_stats():
     conn = sqlite3.connect(DB_NAME)
     c = conn.cursor()
-    yesterday_str = (date.today() - timedelta(days=1)).isoformat()
-    c.execute('DELETE FROM daily_follow_stats WHERE date < ?', (date.today().isoformat(),))
+    yesterday_str = (clock.today() - timedelta(days=1)).isoformat()
+    c.execute('DELETE FROM daily_follow_stats WHERE date < ?', (clock.today().isoformat(),))
     conn.commit()
     conn.close()
 
-def search_and_follow_users(client, max_users_to_follow):
+def search_and_follow_users(client, max_users_to_follow, dry_run=False):
     query = "anti-aging OR wellness OR healthy living -is:retweet lang:en"
     try:
         users_followed_today = get_users_followed_today()
@@ -189,8 +213,11 @@ def search_and_follow_users(client, max_users_to_follow):
                 if is_user_already_followed(author_id):
                     continue
                 # Follow the user
-                client.follow_user(target_user_id=author_id)
-                logging.info(f"Followed user ID {author_id}")
+                if dry_run:
+                    logging.info(f"Dry run - Would follow user ID {author_id}")
+                else:
+                    client.follow_user(target_user_id=author_id)
+                    logging.info(f"Followed user ID {author_id}")
                 # Add to database
                 add_followed_user(author_id)
                 users_followed += 1
@@ -214,13 +241,13 @@ def is_user_already_followed(user_id):
 def add_followed_user(user_id):
     conn = sqlite3.connect(DB_NAME)
     c = conn.cursor()
-    followed_at = datetime.utcnow().isoformat()
+    followed_at = clock.utcnow().isoformat()
     c.execute('INSERT OR IGNORE INTO followed_users (user_id, followed_at) VALUES (?, ?)',
               (user_id, followed_at))
     conn.commit()
     conn.close()
 
-def check_follow_backs_and_unfollow(client):
+def check_follow_backs_and_unfollow(client, dry_run=False):
     conn = sqlite3.connect(DB_NAME)
     c = conn.cursor()
     c.execute('SELECT user_id, followed_at, thanked FROM followed_users')
@@ -228,7 +255,7 @@ def check_follow_backs_and_unfollow(client):
     for row in rows:
         user_id, followed_at_str, thanked = row
         followed_at = datetime.fromisoformat(followed_at_str)
-        time_since_followed = datetime.utcnow() - followed_at
+        time_since_followed = clock.utcnow() - followed_at
         try:
             # Check if the user follows back
             follows_back = client.get_user(id=user_id, user_auth=True).data.following
@@ -236,15 +263,18 @@ def check_follow_backs_and_unfollow(client):
                 logging.info(f"User ID {user_id} followed back.")
                 if not thanked:
                     # Send thank-you tweet
-                    send_thank_you_tweet(client, user_id)
+                    send_thank_you_tweet(client, user_id, dry_run=dry_run)
                     # Update database
                     c.execute('UPDATE followed_users SET thanked = 1 WHERE user_id = ?', (user_id,))
                     conn.commit()
             else:
-                if time_since_followed.total_seconds() > 48 * 3600:
+                if time_since_followed.total_seconds() > UNFOLLOW_AFTER_HOURS * 3600:
                     # Unfollow the user
-                    client.unfollow_user(target_user_id=user_id)
-                    logging.info(f"Unfollowed user ID {user_id} after 48 hours of no follow-back.")
+                    if dry_run:
+                        logging.info(f"Dry run - Would unfollow user ID {user_id}")
+                    else:
+                        client.unfollow_user(target_user_id=user_id)
+                        logging.info(f"Unfollowed user ID {user_id} after {UNFOLLOW_AFTER_HOURS} hours of no follow-back.")
                     # Remove from database
                     c.execute('DELETE FROM followed_users WHERE user_id = ?', (user_id,))
                     conn.commit()
@@ -252,7 +282,7 @@ def check_follow_backs_and_unfollow(client):
             logging.error(f"Error checking follow-back status for user ID {user_id}", exc_info=True)
     conn.close()
 
-def send_thank_you_tweet(client, user_id):
+def send_thank_you_tweet(client, user_id, dry_run=False):
     thank_you_messages = [
         f"Thanks for the follow! 😊 Stay tuned for more anti-aging tips!",
         f"Appreciate the follow! Let's embark on this wellness journey together! 🌟",
@@ -261,6 +291,10 @@ def send_thank_you_tweet(client, user_id):
     message = random.choice(thank_you_messages)
     # Mention the user in the tweet
     message = f"@{get_username(client, user_id)} {message}"
+    if dry_run:
+        print(f"Dry run - Thank-you tweet content: {message}")
+        logging.info(f"Dry run - Thank-you tweet to user ID {user_id} not posted.")
+        return
     try:
         response = client.create_tweet(text=message)
         logging.info(f"Sent thank-you tweet to user ID {user_id}. Response: {response}")
@@ -276,33 +310,40 @@ def get_username(client, user_id):
         logging.error(f"Error fetching username for user ID {user_id}", exc_info=True)
     return "there"
 
-def main():
+def main(twitter_client=None, tweet_generator=generate_tweet, dry_run=False):
     init_db()
     reset_daily_follow_stats()
-    twitter_client = create_twitter_client()
-    dry_run = False  # Set to True for testing without posting
+    if twitter_client is None:
+        twitter_client = create_twitter_client()
     while True:
         if is_within_posting_hours():
             # Generate and post tweet
-            tweet = generate_tweet()
+            tweet = tweet_generator()
             if tweet and is_content_appropriate(tweet):
                 post_tweet(twitter_client, tweet, dry_run=dry_run)
             else:
                 logging.warning("Generated tweet is inappropriate or empty. Skipping.")
             # Randomly decide whether to search and follow users today
             if random.choice([True, False]):
-                max_users_to_follow = random.randint(1, 5)
-                search_and_follow_users(twitter_client, max_users_to_follow=max_users_to_follow)
+                max_users_to_follow = random.randint(DAILY_FOLLOW_LIMIT_MIN, DAILY_FOLLOW_LIMIT_MAX)
+                search_and_follow_users(twitter_client, max_users_to_follow=max_users_to_follow, dry_run=dry_run)
             # Check for follow-backs and unfollow if necessary
-            check_follow_backs_and_unfollow(twitter_client)
+            check_follow_backs_and_unfollow(twitter_client, dry_run=dry_run)
             interval = random.randint(TWEET_INTERVAL_MIN, TWEET_INTERVAL_MAX)
             logging.info(f"Waiting for {interval} seconds before next tweet.")
-            time.sleep(interval)
+            clock.sleep(interval)
         else:
             seconds_until_next_start = calculate_seconds_until_next_window()
             logging.info("Outside of posting hours. Waiting until next posting window.")
-            time.sleep(seconds_until_next_start)
+            clock.sleep(seconds_until_next_start)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Run the Twitter bot.")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Log tweets, follows and unfollows instead of sending them. "
+                             "Uses a separate database so the real follow history is left untouched.")
+    args = parser.parse_args()
+    if args.dry_run:
+        DB_NAME = DRY_RUN_DB_NAME
+    main(dry_run=args.dry_run)
 
@@ -0,0 +1,216 @@
+# simulate.py
+
+import os
+import argparse
+import cProfile
+import logging
+import pstats
+import random
+import tempfile
+import time
+from collections import Counter, namedtuple
+from datetime import datetime, timedelta, timezone
+
+# Configure logging before bot_v4 is imported, otherwise its basicConfig
+# call would send simulated activity to the real logs/bot.log
+logging.basicConfig(
+    filename='simulation.log',
+    filemode='w',
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+import bot_v4
+
+# Minimal stand-ins for the tweepy response objects the bot reads from
+Response = namedtuple('Response', ['data'])
+SimulatedTweet = namedtuple('SimulatedTweet', ['id', 'text', 'author_id'])
+SimulatedUser = namedtuple('SimulatedUser', ['id', 'username', 'following'])
+
+class SimulationFinished(Exception):
+    pass
+
+class SimulatedClock:
+    # Virtual clock that jumps forward instead of sleeping
+    def __init__(self, start, end):
+        self.current = start
+        self.end = end
+
+    def now(self, tz=None):
+        if tz is None:
+            return self.current.replace(tzinfo=None)
+        return self.current.astimezone(tz)
+
+    def utcnow(self):
+        return self.current.replace(tzinfo=None)
+
+    def today(self):
+        return self.current.date()
+
+    def sleep(self, seconds):
+        if self.current + timedelta(seconds=seconds) >= self.end:
+            self.current = self.end
+            raise SimulationFinished()
+        self.current += timedelta(seconds=seconds)
+
+class SimulatedAudience:
+    # Synthetic pool of accounts that tweet about the bot's topics. Each one
+    # follows back with some probability, after a random delay.
+    def __init__(self, size, follow_back_rate, mean_follow_back_hours, rng):
+        self.rng = rng
+        self.users = {}
+        for user_id in range(1, size + 1):
+            self.users[user_id] = {
+                'username': f"sim_user_{user_id}",
+                'follows_back': rng.random() < follow_back_rate,
+                'follow_back_delay': timedelta(hours=rng.expovariate(1 / mean_follow_back_hours)),
+                'followed_at': None,
+            }
+
+    def recent_authors(self, count):
+        return self.rng.sample(list(self.users), min(count, len(self.users)))
+
+    def follows_us(self, user_id, now):
+        user = self.users[user_id]
+        if not user['follows_back'] or user['followed_at'] is None:
+            return False
+        return now >= user['followed_at'] + user['follow_back_delay']
+
+class SimulatedTwitterClient:
+    # Implements the subset of tweepy.Client used by bot_v4 against the
+    # synthetic audience, and counts every call
+    def __init__(self, audience, clock):
+        self.audience = audience
+        self.clock = clock
+        self.calls = Counter()
+        self.daily = {}
+        self.next_tweet_id = 1
+
+    def _record(self, event):
+        day = self.clock.today()
+        self.daily.setdefault(day, Counter())[event] += 1
+
+    def search_recent_tweets(self, query, max_results=10, tweet_fields=None):
+        self.calls['search_recent_tweets'] += 1
+        tweets = []
+        for author_id in self.audience.recent_authors(max_results):
+            tweets.append(SimulatedTweet(self.next_tweet_id, query, author_id))
+            self.next_tweet_id += 1
+        return Response(tweets)
+
+    def follow_user(self, target_user_id):
+        self.calls['follow_user'] += 1
+        self._record('follows')
+        self.audience.users[target_user_id]['followed_at'] = self.clock.current
+
+    def unfollow_user(self, target_user_id):
+        self.calls['unfollow_user'] += 1
+        self._record('unfollows')
+        self.audience.users[target_user_id]['followed_at'] = None
+
+    def get_user(self, id, user_auth=False):
+        self.calls['get_user'] += 1
+        user = self.audience.users[id]
+        following = self.audience.follows_us(id, self.clock.current)
+        return Response(SimulatedUser(id, user['username'], following))
+
+    def create_tweet(self, text):
+        self.calls['create_tweet'] += 1
+        self._record('thank_yous' if text.startswith('@') else 'tweets')
+        tweet_id = self.next_tweet_id
+        self.next_tweet_id += 1
+        return Response({'id': tweet_id, 'text': text})
+
+def generate_simulated_tweet():
+    return "Simulated tweet about anti-aging and healthy living."
+
+def print_report(client, started, finished, wall_seconds):
+    print(f"Simulated {started:%Y-%m-%d %H:%M} to {finished:%Y-%m-%d %H:%M} UTC in {wall_seconds:.2f}s")
+    print()
+    print(f"{'Date':<12}{'Tweets':>8}{'Follows':>9}{'Unfollows':>11}{'Thank-yous':>12}")
+    for day in sorted(client.daily):
+        counts = client.daily[day]
+        print(f"{day.isoformat():<12}{counts['tweets']:>8}{counts['follows']:>9}"
+              f"{counts['unfollows']:>11}{counts['thank_yous']:>12}")
+    print()
+    print("API calls:")
+    for name, count in sorted(client.calls.items()):
+        print(f"  {name}: {count}")
+    followers = sum(1 for user_id in client.audience.users
+                    if client.audience.follows_us(user_id, client.clock.current))
+    print(f"Followers gained: {followers}")
+
+def run_simulation(args):
+    rng = random.Random(args.seed)
+    # bot_v4 draws intervals and follow limits from the global random module
+    random.seed(args.seed)
+
+    if args.start:
+        start = datetime.fromisoformat(args.start).replace(tzinfo=timezone.utc)
+    else:
+        start = datetime.now(timezone.utc)
+    clock = SimulatedClock(start, start + timedelta(days=args.days))
+    audience = SimulatedAudience(args.audience_size, args.follow_back_rate, args.mean_follow_back_hours, rng)
+    client = SimulatedTwitterClient(audience, clock)
+
+    bot_v4.clock = clock
+    bot_v4.TWEET_INTERVAL_MIN = args.interval_min
+    bot_v4.TWEET_INTERVAL_MAX = args.interval_max
+    bot_v4.DAILY_FOLLOW_LIMIT_MIN = args.follow_min
+    bot_v4.DAILY_FOLLOW_LIMIT_MAX = args.follow_max
+    bot_v4.UNFOLLOW_AFTER_HOURS = args.unfollow_after_hours
+
+    # Stamp log records with simulated time instead of wall-clock time
+    def use_simulated_time(record):
+        record.created = clock.current.timestamp()
+        record.msecs = 0
+        return True
+    for handler in logging.getLogger().handlers:
+        handler.addFilter(use_simulated_time)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bot_v4.DB_NAME = args.db or os.path.join(tmp_dir, 'simulation.db')
+        wall_start = time.perf_counter()
+        try:
+            bot_v4.main(twitter_client=client, tweet_generator=generate_simulated_tweet)
+        except SimulationFinished:
+            pass
+        wall_seconds = time.perf_counter() - wall_start
+    print_report(client, start, clock.current, wall_seconds)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay bot_v4 against a simulated audience on a virtual clock.")
+    parser.add_argument('--days', type=float, default=7, help="Simulated days to run (default: 7)")
+    parser.add_argument('--start', help="Simulated start time in UTC, ISO format (default: now)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument('--interval-min', type=int, default=bot_v4.TWEET_INTERVAL_MIN,
+                        help="Override TWEET_INTERVAL_MIN from config.py")
+    parser.add_argument('--interval-max', type=int, default=bot_v4.TWEET_INTERVAL_MAX,
+                        help="Override TWEET_INTERVAL_MAX from config.py")
+    parser.add_argument('--follow-min', type=int, default=bot_v4.DAILY_FOLLOW_LIMIT_MIN,
+                        help="Lower bound of the daily follow limit")
+    parser.add_argument('--follow-max', type=int, default=bot_v4.DAILY_FOLLOW_LIMIT_MAX,
+                        help="Upper bound of the daily follow limit")
+    parser.add_argument('--unfollow-after-hours', type=float, default=bot_v4.UNFOLLOW_AFTER_HOURS,
+                        help="Hours to wait for a follow-back before unfollowing")
+    parser.add_argument('--audience-size', type=int, default=5000,
+                        help="Number of synthetic accounts (default: 5000)")
+    parser.add_argument('--follow-back-rate', type=float, default=0.2,
+                        help="Probability that a followed account follows back (default: 0.2)")
+    parser.add_argument('--mean-follow-back-hours', type=float, default=12,
+                        help="Mean delay before an account follows back (default: 12)")
+    parser.add_argument('--db', help="Keep the simulation database at this path instead of a temp file")
+    parser.add_argument('--profile', action='store_true', help="Profile the run and print the top functions")
+    args = parser.parse_args()
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(run_simulation, args)
+        print()
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
+    else:
+        run_simulation(args)
+
+if __name__ == "__main__":
+    main()